@@ -0,0 +1,33 @@
+import asyncio
+import secrets
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from app.core.config import settings
+from app.core.diagnostics import loop_stall_detector, sample_stacks
+
+router = APIRouter()
+
+def _require_admin(token: str):
+    # Pretend the endpoints do not exist unless diagnostics are switched on
+    if not settings.DIAGNOSTICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not settings.ADMIN_TOKEN or not secrets.compare_digest(token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+@router.get("/admin/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(5.0, gt=0, le=60),
+    interval_ms: float = Query(10.0, ge=1, le=1000),
+    x_admin_token: str = Header(""),
+):
+    """Sample all thread stacks for a while and return flamegraph-ready collapsed stacks."""
+    _require_admin(x_admin_token)
+    # Sampling runs in a worker thread so the loop it observes keeps serving
+    collapsed = await asyncio.to_thread(sample_stacks, seconds, interval_ms / 1000)
+    return PlainTextResponse(collapsed)
+
+@router.get("/admin/loop-stalls")
+async def loop_stalls(x_admin_token: str = Header("")):
+    """Recent event-loop stalls with the stack that was blocking the loop."""
+    _require_admin(x_admin_token)
+    return loop_stall_detector.stats()
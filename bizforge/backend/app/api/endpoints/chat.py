@@ -1,11 +1,19 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from app.core.config import settings
+from app.core.deadline import request_deadline, cancel_on_disconnect
+from app.core.responses import FastJSONResponse
 from app.models.schemas import ChatRequest, ChatResponse
 from app.services.chat_service import chat_service
 
 router = APIRouter()
 
 @router.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, http_request: Request):
+    with request_deadline(settings.CHAT_DEADLINE_SECONDS, http_request):
+        response = await cancel_on_disconnect(http_request, _chat(request))
+    return FastJSONResponse(response)
+
+async def _chat(request: ChatRequest) -> ChatResponse:
     try:
         response = await chat_service.chat_with_branding_assistant(request.message, request.context)
         return ChatResponse(response=response)
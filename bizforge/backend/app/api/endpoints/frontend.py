@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException, Request, Response
+from app.core.compression import negotiate_encoding
+from app.services.frontend_service import frontend_service
+
+router = APIRouter()
+
+@router.api_route("/{asset_path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def frontend_asset(asset_path: str, request: Request):
+    """Serve the frontend, picking a precompressed variant and answering revalidations with 304."""
+    asset = await frontend_service.get(asset_path)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+    if encoding not in asset.variants:
+        encoding = None
+
+    headers = {
+        "Cache-Control": asset.cache_control,
+        "ETag": asset.etags[encoding],
+        "Vary": "Accept-Encoding",
+    }
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if asset.etags[encoding] in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+
+    body = asset.variants[encoding] if encoding else asset.body
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    if request.method == "HEAD":
+        headers["Content-Length"] = str(len(body))
+        return Response(media_type=asset.media_type, headers=headers)
+    return Response(content=body, media_type=asset.media_type, headers=headers)
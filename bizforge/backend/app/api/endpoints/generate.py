@@ -1,23 +1,44 @@
-from fastapi import APIRouter, HTTPException
+import logging
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
-from app.models.schemas import BrandRequest, BrandKit
+from app.core.config import settings
+from app.core.deadline import request_deadline, cancel_on_disconnect, within_deadline
+from app.core.responses import FastJSONResponse
+from app.models.schemas import BrandRequest, BrandKit, StrategyRequest, StrategyAnalysis
 from app.services.branding_service import branding_service
 from app.services.content_service import content_service
 from app.services.visual_service import visual_service
 from app.services.analysis_service import analysis_service
+from app.services.store_service import store_service
+from app.services.strategy_service import strategy_service
 import asyncio
 
+logger = logging.getLogger("bizforge.generate")
+
 router = APIRouter()
 
 @router.post("/generate", response_model=BrandKit)
-async def generate_brand_kit(request: BrandRequest):
+async def generate_brand_kit(request: BrandRequest, http_request: Request):
+    with request_deadline(settings.GENERATE_DEADLINE_SECONDS, http_request):
+        kit = await cancel_on_disconnect(http_request, _build_brand_kit(request))
+    return FastJSONResponse(kit)
+
+async def _build_brand_kit(request: BrandRequest) -> BrandKit:
     try:
+        # Sections that miss the request deadline or fall back to stand-in content are listed here
+        degraded = []
+
         # Run services in parallel where possible
         # 1. Generate identity first (need name for others)
-        identities = await branding_service.generate_brand_identity(
-            request.business_idea, 
-            request.industry, 
-            request.tone
+        identities = await within_deadline(
+            "identity",
+            branding_service.generate_brand_identity(
+                request.business_idea, 
+                request.industry, 
+                request.tone
+            ),
+            lambda: branding_service.fallback_identities(request.business_idea, request.industry, request.tone),
+            degraded
         )
         
         selected_identity = identities[0] # Pick the first one for the full kit generation
@@ -28,15 +49,40 @@ async def generate_brand_kit(request: BrandRequest):
         palette = await visual_service.generate_color_palette(request.tone)
         
         tags, logo_data, sentiment, summary = await asyncio.gather(
-            content_service.generate_social_content(request.business_idea, name),
-            visual_service.generate_logo(name, request.industry, request.tone, palette),
-            analysis_service.analyze_sentiment(request.business_idea),
-            analysis_service.summarize_description(request.business_idea)
+            within_deadline(
+                "social_media",
+                content_service.generate_social_content(request.business_idea, name),
+                lambda: content_service.fallback_social_content(name),
+                degraded
+            ),
+            within_deadline(
+                "logo",
+                visual_service.generate_logo(name, request.industry, request.tone, palette),
+                lambda: visual_service.generate_local_logo(name, request.industry, request.tone, palette),
+                degraded
+            ),
+            within_deadline(
+                "sentiment_analysis",
+                analysis_service.analyze_sentiment(request.business_idea),
+                lambda: "Sentiment analysis pending: request deadline reached.",
+                degraded
+            ),
+            within_deadline(
+                "brand_summary",
+                analysis_service.summarize_description(request.business_idea),
+                lambda: "Summary pending: request deadline reached.",
+                degraded
+            )
         )
         
-        email = await content_service.generate_email(name, request.business_idea)
+        email = await within_deadline(
+            "email_copy",
+            content_service.generate_email(name, request.business_idea),
+            lambda: f"Welcome to {name}! (Email pending: request deadline reached.)",
+            degraded
+        )
 
-        return BrandKit(
+        kit = BrandKit(
             identity=identities,
             description=f"A revolutionary {request.industry} startup focusing on {request.business_idea}.",
             social_media=tags,
@@ -45,9 +91,20 @@ async def generate_brand_kit(request: BrandRequest):
             logo_url=logo_data["url"],
             sentiment_analysis=sentiment,
             color_palette=palette,
-            brand_summary=summary
+            brand_summary=summary,
+            degraded_sections=degraded
         )
 
+        # Keep the kit so it can be listed and searched later without regenerating.
+        # Degraded kits hold stand-in sections nothing ever completes, so they are not stored.
+        if not degraded:
+            try:
+                await store_service.save_kit(request.business_idea, request.industry, request.tone, kit)
+            except Exception:
+                logger.exception("Failed to store brand kit")
+
+        return kit
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -58,8 +115,12 @@ class RegenerateLogoRequest(BaseModel):
     color_palette: list[str]
 
 @router.post("/regenerate-logo")
-async def regenerate_logo(request: RegenerateLogoRequest):
+async def regenerate_logo(request: RegenerateLogoRequest, http_request: Request):
     """Regenerate logo without regenerating entire brand kit."""
+    with request_deadline(settings.GENERATE_DEADLINE_SECONDS, http_request):
+        return await cancel_on_disconnect(http_request, _regenerate_logo(request))
+
+async def _regenerate_logo(request: RegenerateLogoRequest) -> dict:
     try:
         logo_data = await visual_service.generate_logo(
             request.name,
@@ -72,15 +133,33 @@ async def regenerate_logo(request: RegenerateLogoRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/analyze-strategy")
-async def analyze_strategy(request: BrandRequest):
+@router.post("/analyze-strategy", response_model=StrategyAnalysis)
+async def analyze_strategy(request: BrandRequest, http_request: Request):
     """Generate comprehensive startup strategy analysis."""
-    from app.services.strategy_service import strategy_service
-    from app.models.schemas import StrategyRequest, StrategyAnalysis
-    
+    with request_deadline(settings.STRATEGY_DEADLINE_SECONDS, http_request):
+        analysis = await cancel_on_disconnect(http_request, _analyze_strategy(request))
+    return FastJSONResponse(analysis)
+
+async def _analyze_strategy(request: BrandRequest) -> StrategyAnalysis:
     try:
         strategy_request = StrategyRequest(business_idea=request.business_idea)
-        analysis = await strategy_service.analyze_strategy(strategy_request.business_idea)
+        degraded = []
+        analysis = await within_deadline(
+            "strategy",
+            strategy_service.analyze_strategy(strategy_request.business_idea),
+            lambda: strategy_service.fallback_analysis(strategy_request.business_idea),
+            degraded
+        )
+
+        # Only real analyses are kept; the generic fallback would pollute list and search
+        if degraded:
+            analysis.degraded = True
+        else:
+            try:
+                await store_service.save_strategy(strategy_request.business_idea, analysis)
+            except Exception:
+                logger.exception("Failed to store strategy analysis")
+
         return analysis
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,75 @@
+import base64
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import RedirectResponse
+from typing import Optional
+from app.core.responses import FastJSONResponse
+from app.models.schemas import StoredKit, StoredKitPage, StoredStrategy, StoredStrategyPage
+from app.services.store_service import store_service
+
+router = APIRouter()
+
+@router.get("/kits", response_model=StoredKitPage)
+async def list_kits(
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    brand_name: Optional[str] = None,
+    industry: Optional[str] = None,
+):
+    """List previously generated brand kits, newest first."""
+    return FastJSONResponse(await store_service.list_kits(limit, offset, brand_name, industry))
+
+@router.get("/kits/search", response_model=StoredKitPage)
+async def search_kits(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    """Full-text search over brand name, industry and business idea."""
+    return FastJSONResponse(await store_service.search_kits(q, limit, offset))
+
+@router.get("/kits/{kit_id}", response_model=StoredKit)
+async def get_kit(kit_id: int):
+    kit = await store_service.get_kit(kit_id)
+    if kit is None:
+        raise HTTPException(status_code=404, detail="Brand kit not found")
+    return FastJSONResponse(kit)
+
+@router.get("/kits/{kit_id}/logo")
+async def get_kit_logo(kit_id: int):
+    """The kit's logo image; inline images are decoded, linked ones are redirected to."""
+    logo_url = await store_service.get_kit_logo(kit_id)
+    if not logo_url:
+        raise HTTPException(status_code=404, detail="Logo not found")
+    if not logo_url.startswith("data:"):
+        return RedirectResponse(logo_url)
+
+    header, _, data = logo_url.partition(",")
+    media_type = header[len("data:"):].split(";")[0] or "application/octet-stream"
+    body = base64.b64decode(data) if header.endswith(";base64") else data.encode("utf-8")
+    # Stored kits never change, so neither does their logo
+    return Response(content=body, media_type=media_type, headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+@router.get("/strategies", response_model=StoredStrategyPage)
+async def list_strategies(
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    industry: Optional[str] = None,
+):
+    """List previously generated strategy analyses, newest first."""
+    return FastJSONResponse(await store_service.list_strategies(limit, offset, industry))
+
+@router.get("/strategies/search", response_model=StoredStrategyPage)
+async def search_strategies(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    """Full-text search over business idea and industry category."""
+    return FastJSONResponse(await store_service.search_strategies(q, limit, offset))
+
+@router.get("/strategies/{strategy_id}", response_model=StoredStrategy)
+async def get_strategy(strategy_id: int):
+    strategy = await store_service.get_strategy(strategy_id)
+    if strategy is None:
+        raise HTTPException(status_code=404, detail="Strategy analysis not found")
+    return FastJSONResponse(strategy)
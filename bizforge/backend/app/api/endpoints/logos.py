@@ -0,0 +1,23 @@
+from fastapi import APIRouter, HTTPException, Query, Response
+from app.services.logo_service import logo_service
+
+router = APIRouter()
+
+@router.get("/logos/{logo_id}.svg")
+async def get_logo(
+    logo_id: str,
+    name: str = Query(None, max_length=120),
+    colors: str = Query("", max_length=200),
+    layout: str = Query("", max_length=20),
+    icon: str = Query("", max_length=20),
+):
+    """Serve a locally rendered SVG logo, re-rendering it from the URL's inputs on a cache miss."""
+    svg = logo_service.get_svg(logo_id, name, colors, layout, icon)
+    if svg is None:
+        raise HTTPException(status_code=404, detail="Logo not found")
+    # Ids are content hashes, so the body never changes for a given URL
+    return Response(
+        content=svg,
+        media_type="image/svg+xml",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
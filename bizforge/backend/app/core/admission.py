@@ -0,0 +1,181 @@
+import asyncio
+import heapq
+import itertools
+import json
+import math
+import time
+from typing import Dict, List, Optional
+
+
+class Overloaded(Exception):
+    """Raised when a request cannot be admitted within the wait budget."""
+
+    def __init__(self, retry_after: float):
+        super().__init__("Server is overloaded, retry later")
+        self.retry_after = retry_after
+
+
+class TrafficClass:
+    def __init__(self, name: str, priority: int, limit: int):
+        self.name = name
+        self.priority = priority  # Lower value is served first
+        self.limit = limit
+        self.in_flight = 0
+        self.queued = 0
+        self.shed = 0
+
+
+class AdmissionController:
+    """
+    Shared concurrency budget with per-class limits and priority dispatch.
+    Freed slots go to the highest-priority waiter whose class still has room,
+    so interactive traffic overtakes queued bulk work.
+    """
+
+    def __init__(self, total_slots: int, classes: List[TrafficClass], wait_budget: float, max_queue: int):
+        self.total_slots = total_slots
+        self.wait_budget = wait_budget
+        self.max_queue = max_queue
+        self.classes: Dict[str, TrafficClass] = {c.name: c for c in classes}
+        self._in_flight = 0
+        self._waiters: list = []  # heap of (priority, seq, class name, future)
+        self._seq = itertools.count()
+
+    def _has_room(self, traffic_class: TrafficClass) -> bool:
+        return self._in_flight < self.total_slots and traffic_class.in_flight < traffic_class.limit
+
+    def _admit(self, traffic_class: TrafficClass):
+        self._in_flight += 1
+        traffic_class.in_flight += 1
+
+    def _waiting_ahead(self, traffic_class: TrafficClass) -> bool:
+        """Is a waiter of equal or higher priority able to take a free slot?"""
+        return any(
+            priority <= traffic_class.priority
+            and not future.done()
+            and self.classes[name].in_flight < self.classes[name].limit
+            for priority, _, name, future in self._waiters
+        )
+
+    async def acquire(self, class_name: str):
+        traffic_class = self.classes[class_name]
+        if self._has_room(traffic_class) and not self._waiting_ahead(traffic_class):
+            self._admit(traffic_class)
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            traffic_class.shed += 1
+            raise Overloaded(self.wait_budget)
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (traffic_class.priority, next(self._seq), class_name, future)
+        heapq.heappush(self._waiters, entry)
+        traffic_class.queued += 1
+        # A slot may already be free (e.g. only blocked by fairness ordering)
+        self._dispatch()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=self.wait_budget)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # Slot was granted just as we gave up; hand it back
+                self.release(class_name)
+            else:
+                future.cancel()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            traffic_class.shed += 1
+            raise Overloaded(self.wait_budget)
+        finally:
+            traffic_class.queued -= 1
+            self._remove(entry)
+
+    def release(self, class_name: str):
+        traffic_class = self.classes[class_name]
+        self._in_flight -= 1
+        traffic_class.in_flight -= 1
+        self._dispatch()
+
+    def _remove(self, entry):
+        try:
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+        except ValueError:
+            pass
+
+    def _dispatch(self):
+        """Grant free slots to waiters in priority order, skipping classes at their limit."""
+        for entry in sorted(self._waiters):
+            if self._in_flight >= self.total_slots:
+                break
+            _, _, class_name, future = entry
+            traffic_class = self.classes[class_name]
+            if future.done() or traffic_class.in_flight >= traffic_class.limit:
+                continue
+            self._admit(traffic_class)
+            future.set_result(None)
+            self._remove(entry)
+
+    def stats(self) -> dict:
+        return {
+            "total_slots": self.total_slots,
+            "in_flight": self._in_flight,
+            "queue_depth": sum(1 for *_, future in self._waiters if not future.done()),
+            "classes": {
+                c.name: {
+                    "priority": c.priority,
+                    "limit": c.limit,
+                    "in_flight": c.in_flight,
+                    "queued": c.queued,
+                    "shed": c.shed,
+                }
+                for c in self.classes.values()
+            },
+        }
+
+
+class AdmissionMiddleware:
+    """ASGI middleware that routes requests through an AdmissionController by path."""
+
+    def __init__(self, app, controller: AdmissionController, routes: Dict[str, str]):
+        self.app = app
+        self.controller = controller
+        self.routes = routes
+
+    def _classify(self, scope) -> Optional[str]:
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            return None
+        return self.routes.get(scope["path"].rstrip("/"))
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            # Request deadlines count from here, so queueing below is part of the budget
+            scope.setdefault("state", {})["received_at"] = time.monotonic()
+
+        class_name = self._classify(scope)
+        if class_name is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.controller.acquire(class_name)
+        except Overloaded as e:
+            await self._reject(send, e.retry_after)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(class_name)
+
+    async def _reject(self, send, retry_after: float):
+        body = json.dumps({"detail": "Server is busy, please retry shortly."}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"retry-after", str(max(math.ceil(retry_after), 1)).encode("ascii")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -22,4 +23,34 @@ class Settings(BaseSettings):
     IBM_WATSONX_API_KEY: str = os.getenv("IBM_WATSONX_API_KEY", "")
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
 
+    # Idle pooled upstream connections (including those opened at warm-up) are kept this long
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "300"))
+
+    # Local store for generated kits and strategies
+    DATABASE_PATH: str = os.getenv("DATABASE_PATH", "bizforge.db")
+
+    # Static frontend served by the API; run build_frontend.py for hashed, precompressed assets
+    FRONTEND_DIR: str = os.getenv("FRONTEND_DIR", str(Path(__file__).resolve().parents[3] / "frontend"))
+
+    # Overall time budget per request, shared by every upstream call it makes
+    GENERATE_DEADLINE_SECONDS: float = float(os.getenv("GENERATE_DEADLINE_SECONDS", "45"))
+    CHAT_DEADLINE_SECONDS: float = float(os.getenv("CHAT_DEADLINE_SECONDS", "30"))
+    STRATEGY_DEADLINE_SECONDS: float = float(os.getenv("STRATEGY_DEADLINE_SECONDS", "60"))
+
+    # Responses smaller than this are sent uncompressed
+    COMPRESSION_MINIMUM_SIZE: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+
+    # Opt-in diagnostics: event-loop stall logging and the /admin profiling endpoints
+    DIAGNOSTICS_ENABLED: bool = os.getenv("DIAGNOSTICS_ENABLED", "false").lower() == "true"
+    LOOP_STALL_THRESHOLD_MS: float = float(os.getenv("LOOP_STALL_THRESHOLD_MS", "100"))
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")
+
+    # Admission control: shared upstream slots, per-class caps and queueing budget
+    ADMISSION_TOTAL_SLOTS: int = int(os.getenv("ADMISSION_TOTAL_SLOTS", "16"))
+    ADMISSION_CHAT_LIMIT: int = int(os.getenv("ADMISSION_CHAT_LIMIT", "16"))
+    ADMISSION_GENERATE_LIMIT: int = int(os.getenv("ADMISSION_GENERATE_LIMIT", "8"))
+    ADMISSION_BATCH_LIMIT: int = int(os.getenv("ADMISSION_BATCH_LIMIT", "4"))
+    ADMISSION_WAIT_BUDGET_SECONDS: float = float(os.getenv("ADMISSION_WAIT_BUDGET_SECONDS", "5"))
+    ADMISSION_MAX_QUEUE: int = int(os.getenv("ADMISSION_MAX_QUEUE", "64"))
+
 settings = Settings()
@@ -0,0 +1,135 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from fastapi import HTTPException, Request
+
+T = TypeVar("T")
+
+# Smallest timeout handed to an upstream call once the budget is nearly spent
+MIN_UPSTREAM_TIMEOUT = 0.5
+
+# How often to check whether the client has gone away
+DISCONNECT_POLL_INTERVAL = 0.5
+
+
+class Deadline:
+    """Absolute point in time by which a request must finish."""
+
+    def __init__(self, seconds: float, started_at: Optional[float] = None):
+        self.expires_at = (started_at if started_at is not None else time.monotonic()) + seconds
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("current_deadline", default=None)
+
+# Set by within_deadline for the section being awaited; services append to it when they fall back
+_section_fallbacks: ContextVar[Optional[list]] = ContextVar("section_fallbacks", default=None)
+
+
+@contextmanager
+def request_deadline(seconds: float, request: Optional[Request] = None):
+    """
+    Bind a deadline to the current context; tasks spawned inside inherit it.
+    The budget counts from when the request arrived (stamped by the admission
+    middleware), so time spent queueing for a slot is included.
+    """
+    received_at = getattr(request.state, "received_at", None) if request is not None else None
+    deadline = Deadline(seconds, started_at=received_at)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+def upstream_timeout(default: float) -> float:
+    """Shrink a service's usual upstream timeout to what is left of the request budget."""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default
+    return max(min(default, deadline.remaining()), MIN_UPSTREAM_TIMEOUT)
+
+
+def report_fallback():
+    """Called by services that answer with stand-in content instead of a real upstream result."""
+    fallbacks = _section_fallbacks.get()
+    if fallbacks is not None:
+        fallbacks.append(True)
+
+
+async def within_deadline(
+    section: str,
+    coro: Awaitable[T],
+    fallback: Callable[[], T],
+    degraded: list,
+) -> T:
+    """
+    Await one section of a response under the current deadline.
+    Sections that are cut off, only finish after the budget ran out, or
+    whose service reported a fallback (no API key, upstream error) are
+    recorded in `degraded` and return `fallback()` where needed.
+    """
+    fallbacks = []
+    token = _section_fallbacks.set(fallbacks)
+    try:
+        result = await _await_section(section, coro, fallback, degraded)
+    finally:
+        _section_fallbacks.reset(token)
+
+    if fallbacks and section not in degraded:
+        degraded.append(section)
+    return result
+
+
+async def _await_section(section: str, coro: Awaitable[T], fallback: Callable[[], T], degraded: list) -> T:
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return await coro
+
+    if deadline.expired():
+        coro.close()
+        degraded.append(section)
+        return fallback()
+
+    try:
+        # Small grace so services can return their own fallback first
+        result = await asyncio.wait_for(coro, timeout=deadline.remaining() + MIN_UPSTREAM_TIMEOUT)
+    except asyncio.TimeoutError:
+        degraded.append(section)
+        return fallback()
+
+    if deadline.expired():
+        degraded.append(section)
+    return result
+
+
+async def cancel_on_disconnect(request: Request, coro: Awaitable[T]) -> T:
+    """Run `coro`, cancelling it (and every task it awaits) if the client disconnects."""
+    task = asyncio.ensure_future(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                raise HTTPException(status_code=499, detail="Client closed request")
+    finally:
+        if not task.done():
+            task.cancel()
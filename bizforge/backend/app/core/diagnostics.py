@@ -0,0 +1,117 @@
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from typing import Optional
+from app.core.config import settings
+
+logger = logging.getLogger("bizforge.diagnostics")
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)})"
+
+
+def _collapse(frame, thread_name: str) -> str:
+    """Root-to-leaf frame labels joined with ';', as flamegraph tools expect."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    return ";".join(reversed(labels))
+
+
+class LoopStallDetector:
+    """
+    Watchdog thread that notices when the event loop stops running callbacks.
+    The loop bumps a heartbeat every `interval`; if the watchdog sees no beat
+    for longer than `threshold`, it logs the loop thread's current stack,
+    i.e. the code that is blocking it right now.
+    """
+
+    def __init__(self, threshold: float, max_reports: int = 20):
+        self.threshold = threshold
+        self.interval = max(threshold / 4, 0.005)
+        self.reports = deque(maxlen=max_reports)
+        self.stalls = 0
+        self._loop = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, loop):
+        """Must be called from the loop's own thread."""
+        if self._thread is not None:
+            return
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        loop.call_soon(self._beat)
+        self._thread = threading.Thread(target=self._watch, name="loop-stall-detector", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _beat(self):
+        self._last_beat = time.monotonic()
+        if not self._stop.is_set():
+            self._loop.call_later(self.interval, self._beat)
+
+    def _watch(self):
+        reported_beat = None
+        while not self._stop.wait(self.interval):
+            beat = self._last_beat
+            blocked_for = time.monotonic() - beat - self.interval
+            if blocked_for < self.threshold or beat == reported_beat:
+                continue
+            # One report per stall, taken while the loop is still blocked
+            reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+            self.stalls += 1
+            self.reports.append({
+                "detected_at": time.time(),
+                "blocked_ms": round(blocked_for * 1000, 1),
+                "stack": stack,
+            })
+            logger.warning("Event loop blocked for over %.0f ms:\n%s", blocked_for * 1000, stack)
+
+    def stats(self) -> dict:
+        return {
+            "running": self._thread is not None,
+            "threshold_ms": self.threshold * 1000,
+            "stalls": self.stalls,
+            "recent": list(self.reports),
+        }
+
+
+def sample_stacks(duration: float, interval: float) -> str:
+    """
+    Sample every thread's stack for `duration` seconds and return the counts
+    in collapsed-stack format ("frame;frame;frame count" per line), ready
+    for flamegraph.pl or speedscope. Blocks, so run it off the event loop.
+    """
+    own_id = threading.get_ident()
+    counts: Counter = Counter()
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            counts[_collapse(frame, names.get(thread_id, f"thread-{thread_id}"))] += 1
+        time.sleep(interval)
+    return "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
+
+loop_stall_detector = LoopStallDetector(settings.LOOP_STALL_THRESHOLD_MS / 1000)
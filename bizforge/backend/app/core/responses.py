@@ -0,0 +1,17 @@
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    JSON response that serializes Pydantic models straight to bytes with
+    pydantic-core, and everything else with orjson.
+    Returning one of these from an endpoint also skips FastAPI's
+    response_model re-validation, which is redundant for models the
+    services already built.
+    """
+
+    def render(self, content) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return super().render(content)
@@ -0,0 +1,80 @@
+import asyncio
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+from app.core.config import settings
+from app.core.http import http_client
+from app.services.frontend_service import frontend_service
+from app.services.logo_service import logo_service
+from app.services.store_service import store_service
+
+# Upstream hosts, pre-connected only when the matching API key is configured.
+# Those connections survive HTTP_KEEPALIVE_EXPIRY_SECONDS of idleness.
+UPSTREAMS = [
+    ("GROQ_API_KEY", "https://api.groq.com/openai/v1/models"),
+    ("STABILITY_API_KEY", "https://api.stability.ai/v1/engines/list"),
+    ("HF_API_KEY", "https://api-inference.huggingface.co/"),
+]
+
+UPSTREAM_WARMUP_TIMEOUT = 5.0
+
+
+class WarmupState:
+    def __init__(self):
+        self.ready = False
+        self.import_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+        self.steps: dict = {}
+        self.errors: dict = {}
+
+    def summary(self) -> dict:
+        return {
+            "ready": self.ready,
+            "import_seconds": self.import_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "steps_ms": self.steps,
+            "errors": self.errors,
+        }
+
+
+warmup_state = WarmupState()
+
+
+async def _step(name: str, coro):
+    start = time.perf_counter()
+    try:
+        await coro
+    except Exception as e:
+        # A failed step only costs the first request some latency; never fatal
+        warmup_state.errors[name] = str(e)
+    warmup_state.steps[name] = round((time.perf_counter() - start) * 1000, 1)
+
+
+async def _prime_caches(app):
+    app.openapi()
+    logo_service.render("BizForge", ["#6366f1", "#8b5cf6", "#ec4899"])
+    await store_service.warm()
+    await frontend_service.warm()
+
+
+async def _connect_upstream(url: str):
+    # Any response will do: resolving, connecting and the TLS handshake
+    # leave a connection in the shared pool for the first real request
+    await http_client().head(url, timeout=UPSTREAM_WARMUP_TIMEOUT)
+
+
+async def warm_up(app, import_started: float):
+    """Prepare the process for traffic; flips warmup_state.ready when done."""
+    warmup_state.import_seconds = round(time.perf_counter() - import_started, 3)
+    start = time.perf_counter()
+
+    await _step("caches", _prime_caches(app))
+    await asyncio.gather(*(
+        _step(f"connect:{urlsplit(url).hostname}", _connect_upstream(url))
+        for key, url in UPSTREAMS
+        if getattr(settings, key)
+    ))
+
+    warmup_state.warmup_seconds = round(time.perf_counter() - start, 3)
+    warmup_state.ready = True
@@ -1,12 +1,61 @@
-from fastapi import FastAPI
+import time
+# Taken before the heavy imports so startup time includes them
+_import_started = time.perf_counter()
+
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.api.endpoints import generate, chat
+from app.core.admission import AdmissionController, AdmissionMiddleware, TrafficClass
+from app.core.compression import CompressionMiddleware
+from app.core.diagnostics import loop_stall_detector
+from app.core.http import close_http_client
+from app.core.warmup import warm_up, warmup_state
+from app.core.responses import FastJSONResponse
+from app.api.endpoints import generate, chat, logos, library, admin, frontend
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.DIAGNOSTICS_ENABLED:
+        loop_stall_detector.start(asyncio.get_running_loop())
+    # Warm up in the background so /ready can report progress while it runs
+    warmup_task = asyncio.create_task(warm_up(app, _import_started))
+    yield
+    warmup_task.cancel()
+    loop_stall_detector.stop()
+    await close_http_client()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="AI Branding Automation Platform API",
     version="1.0.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
+)
+
+# Interactive chat > brand kit generation > strategy/batch work
+admission_controller = AdmissionController(
+    total_slots=settings.ADMISSION_TOTAL_SLOTS,
+    classes=[
+        TrafficClass("interactive", priority=0, limit=settings.ADMISSION_CHAT_LIMIT),
+        TrafficClass("generate", priority=1, limit=settings.ADMISSION_GENERATE_LIMIT),
+        TrafficClass("batch", priority=2, limit=settings.ADMISSION_BATCH_LIMIT),
+    ],
+    wait_budget=settings.ADMISSION_WAIT_BUDGET_SECONDS,
+    max_queue=settings.ADMISSION_MAX_QUEUE,
+)
+
+# Added before CORS so shed (503) responses still carry CORS headers
+app.add_middleware(
+    AdmissionMiddleware,
+    controller=admission_controller,
+    routes={
+        f"{settings.API_V1_STR}/chat": "interactive",
+        f"{settings.API_V1_STR}/generate": "generate",
+        f"{settings.API_V1_STR}/regenerate-logo": "generate",
+        f"{settings.API_V1_STR}/analyze-strategy": "batch",
+    },
 )
 
 # Set all CORS enabled origins
@@ -18,9 +67,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost, so every response (including CORS and 503s) is eligible
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+)
+
 app.include_router(generate.router, prefix=settings.API_V1_STR)
 app.include_router(chat.router, prefix=settings.API_V1_STR)
+app.include_router(logos.router, prefix=settings.API_V1_STR)
+app.include_router(library.router, prefix=settings.API_V1_STR)
+app.include_router(admin.router, prefix=settings.API_V1_STR)
+
+@app.get("/ready")
+async def ready(response: Response):
+    """Readiness probe: 503 until the warm-up stage has finished."""
+    if not warmup_state.ready:
+        response.status_code = 503
+    return warmup_state.summary()
+
+@app.get("/admission")
+async def admission_stats():
+    """Current in-flight and queued request counts per traffic class."""
+    return admission_controller.stats()
 
-@app.get("/")
-async def root():
-    return {"message": "Welcome to BizForge API. Visit /docs for Swagger UI."}
+# Registered last: the frontend catch-all must not shadow any API route
+app.include_router(frontend.router)
@@ -29,6 +29,7 @@ class BrandKit(BaseModel):
     sentiment_analysis: str # "Positive tone detected..."
     color_palette: List[str] # Hex codes
     brand_summary: str # Elevator pitch
+    degraded_sections: List[str] = [] # Sections holding fallback content (deadline missed or upstream unavailable)
 
 class ChatRequest(BaseModel):
     message: str
@@ -70,3 +71,38 @@ class StrategyAnalysis(BaseModel):
     attraction_strategy: AttractionStrategyData
     marketing_strategies: MarketingStrategiesData
     strategic_advice: str
+    degraded: bool = False # Generic fallback analysis returned because the upstream call failed or missed the deadline
+
+# --- Stored Results Models ---
+class StoredKitSummary(BaseModel):
+    id: int
+    brand_name: str
+    industry: str
+    business_idea: str
+    tone: Optional[str] = None
+    logo_url: Optional[str] = None # Link to the logo, never an inline image
+    created_at: float # Unix timestamp
+
+class StoredKit(StoredKitSummary):
+    kit: BrandKit
+
+class StoredKitPage(BaseModel):
+    items: List[StoredKitSummary]
+    total: int
+    limit: int
+    offset: int
+
+class StoredStrategySummary(BaseModel):
+    id: int
+    business_idea: str
+    industry_category: str
+    created_at: float # Unix timestamp
+
+class StoredStrategy(StoredStrategySummary):
+    analysis: StrategyAnalysis
+
+class StoredStrategyPage(BaseModel):
+    items: List[StoredStrategySummary]
+    total: int
+    limit: int
+    offset: int
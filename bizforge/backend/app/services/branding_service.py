@@ -1,13 +1,14 @@
-import httpx
 import json
 from app.core.config import settings
+from app.core.http import http_client
+from app.core.deadline import report_fallback, upstream_timeout
 from app.models.schemas import BrandIdentity
 
 class BrandingService:
     async def generate_brand_identity(self, idea: str, industry: str, tone: str) -> list[BrandIdentity]:
         if not settings.GROQ_API_KEY:
              # Fallback to mock if no key
-             return self._mock_generation(idea, industry, tone)
+             return self.fallback_identities(idea, industry, tone)
 
         prompt = f"""
         Act as a professional branding agency.
@@ -28,33 +29,34 @@ class BrandingService:
         """
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.groq.com/openai/v1/chat/completions",
-                    headers={"Authorization": f"Bearer {settings.GROQ_API_KEY}"},
-                    json={
-                        "model": settings.GROQ_MODEL,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0.7
-                    },
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
+            client = http_client()
+            response = await client.post(
+                "https://api.groq.com/openai/v1/chat/completions",
+                headers={"Authorization": f"Bearer {settings.GROQ_API_KEY}"},
+                json={
+                    "model": settings.GROQ_MODEL,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": 0.7
+                },
+                timeout=upstream_timeout(30.0)
+            )
+            response.raise_for_status()
+            data = response.json()
+            content = data["choices"][0]["message"]["content"]
                 
-                # Clean content if it has markdown ticks
-                content = content.replace("```json", "").replace("```", "").strip()
+            # Clean content if it has markdown ticks
+            content = content.replace("```json", "").replace("```", "").strip()
                 
-                parsed = json.loads(content)
-                return [BrandIdentity(**item) for item in parsed]
+            parsed = json.loads(content)
+            return [BrandIdentity(**item) for item in parsed]
 
         except Exception as e:
             print(f"Branding Service Error: {e}")
-            return self._mock_generation(idea, industry, tone)
+            return self.fallback_identities(idea, industry, tone)
 
-    def _mock_generation(self, idea, industry, tone):
+    def fallback_identities(self, idea, industry, tone):
         # Fallback simulation
+        report_fallback()
         return [
             BrandIdentity(name="SimuBrand", tagline="Simulation Mode Active", score=85),
             BrandIdentity(name="MockForge", tagline="Please add API Keys", score=88),
@@ -1,5 +1,6 @@
-import httpx
 from app.core.config import settings
+from app.core.http import http_client
+from app.core.deadline import upstream_timeout
 
 class ChatService:
     async def chat_with_branding_assistant(self, message: str, context: str = "") -> str:
@@ -31,21 +32,21 @@ class ChatService:
         """
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.groq.com/openai/v1/chat/completions",
-                    headers={"Authorization": f"Bearer {settings.GROQ_API_KEY}"},
-                    json={
-                        "model": settings.GROQ_MODEL,
-                        "messages": [
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": message}
-                        ],
-                        "temperature": 0.7
-                    },
-                    timeout=30.0
-                )
-                return response.json()["choices"][0]["message"]["content"]
+            client = http_client()
+            response = await client.post(
+                "https://api.groq.com/openai/v1/chat/completions",
+                headers={"Authorization": f"Bearer {settings.GROQ_API_KEY}"},
+                json={
+                    "model": settings.GROQ_MODEL,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": message}
+                    ],
+                    "temperature": 0.7
+                },
+                timeout=upstream_timeout(30.0)
+            )
+            return response.json()["choices"][0]["message"]["content"]
         except Exception as e:
             return f"Chat Error: {str(e)}"
 
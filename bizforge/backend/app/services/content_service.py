@@ -1,12 +1,14 @@
-import httpx
+import json
 from typing import List
 from app.core.config import settings
+from app.core.http import http_client
+from app.core.deadline import report_fallback, upstream_timeout
 from app.models.schemas import SocialContent
 
 class ContentService:
     async def generate_social_content(self, idea: str, name: str) -> List[SocialContent]:
         if not settings.GROQ_API_KEY:
-            return self._mock_social(name)
+            return self.fallback_social_content(name)
 
         prompt = f"""
         Generate 3 social media posts for a new brand named "{name}". 
@@ -17,49 +19,51 @@ class ContentService:
         """
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.groq.com/openai/v1/chat/completions",
-                    headers={"Authorization": f"Bearer {settings.GROQ_API_KEY}"},
-                    json={
-                        "model": settings.GROQ_MODEL,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0.7
-                    },
-                    timeout=30.0
-                )
-                import json
-                data = response.json()
-                content = data["choices"][0]["message"]["content"].replace("```json", "").replace("```", "").strip()
-                parsed = json.loads(content)
-                return [SocialContent(**item) for item in parsed]
+            client = http_client()
+            response = await client.post(
+                "https://api.groq.com/openai/v1/chat/completions",
+                headers={"Authorization": f"Bearer {settings.GROQ_API_KEY}"},
+                json={
+                    "model": settings.GROQ_MODEL,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": 0.7
+                },
+                timeout=upstream_timeout(30.0)
+            )
+            data = response.json()
+            content = data["choices"][0]["message"]["content"].replace("```json", "").replace("```", "").strip()
+            parsed = json.loads(content)
+            return [SocialContent(**item) for item in parsed]
         except Exception as e:
             print(f"Content Service Error: {e}")
-            return self._mock_social(name)
+            return self.fallback_social_content(name)
 
     async def generate_email(self, name: str, idea: str) -> str:
         if not settings.GROQ_API_KEY:
+            report_fallback()
             return f"Welcome to {name}! (Simulation Mode)"
 
         prompt = f"Write a short warm welcome email for a new customer of {name}, a brand about {idea}."
         
         try:
-             async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.groq.com/openai/v1/chat/completions",
-                    headers={"Authorization": f"Bearer {settings.GROQ_API_KEY}"},
-                    json={
-                        "model": "llama-3.3-70b-versatile",
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0.7
-                    },
-                    timeout=30.0
-                )
-                return response.json()["choices"][0]["message"]["content"]
-        except:
+            client = http_client()
+            response = await client.post(
+                "https://api.groq.com/openai/v1/chat/completions",
+                headers={"Authorization": f"Bearer {settings.GROQ_API_KEY}"},
+                json={
+                    "model": "llama-3.3-70b-versatile",
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": 0.7
+                },
+                timeout=upstream_timeout(30.0)
+            )
+            return response.json()["choices"][0]["message"]["content"]
+        except Exception:
+            report_fallback()
             return "Welcome email generation failed."
 
-    def _mock_social(self, name):
+    def fallback_social_content(self, name):
+        report_fallback()
         return [
             SocialContent(platform="Error", content="Please configure GROQ_API_KEY in .env", hashtags=["#ConfigNeeded"])
         ]
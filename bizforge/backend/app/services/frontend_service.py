@@ -0,0 +1,96 @@
+import asyncio
+import hashlib
+import json
+import mimetypes
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+from app.core.compression import COMPRESSIBLE_TYPES, brotli, compress_body
+from app.core.config import settings
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+VARIANT_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+class Asset:
+    def __init__(self, body: bytes, media_type: str, cache_control: str, variants: Dict[str, bytes]):
+        self.body = body
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.variants = variants
+        digest = hashlib.sha256(body).hexdigest()[:16]
+        # Each encoding is a different representation, so it gets its own ETag
+        self.etags = {None: f'"{digest}"', **{enc: f'"{digest}-{enc}"' for enc in variants}}
+
+
+class FrontendService:
+    """
+    Keeps the built frontend in memory. Content-hashed files listed in the
+    build manifest are cached forever; everything else revalidates by ETag.
+    Falls back to the unbuilt sources (no hashing, no .gz/.br files) when
+    build_frontend.py has not been run; their compressed variants are then
+    built in memory at a cheaper setting, so every encoding still has its
+    own ETag. Loading always happens in a worker thread, never on the loop.
+    """
+
+    def __init__(self, source_dir: Path):
+        self.source_dir = source_dir
+        self.dist_dir = source_dir / "dist"
+        self._assets: Optional[Dict[str, Asset]] = None
+        self._lock = threading.Lock()
+
+    async def warm(self):
+        """Read (and compress) the assets ahead of the first request."""
+        await asyncio.to_thread(self.load)
+
+    def load(self) -> Dict[str, Asset]:
+        with self._lock:
+            if self._assets is None:
+                self._assets = self._load()
+            return self._assets
+
+    def _load(self) -> Dict[str, Asset]:
+        root = self.dist_dir if (self.dist_dir / "index.html").is_file() else self.source_dir
+        manifest_path = root / "manifest.json"
+        hashed = set(json.loads(manifest_path.read_text("utf-8")).values()) if manifest_path.is_file() else set()
+
+        assets = {}
+        if root.is_dir():
+            for path in root.rglob("*"):
+                if not path.is_file() or path.suffix in (".br", ".gz") or path.name == "manifest.json":
+                    continue
+                if root == self.source_dir and self.dist_dir in path.parents:
+                    continue
+                relative = path.relative_to(root).as_posix()
+                body = path.read_bytes()
+                media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+                if root == self.dist_dir:
+                    variants = {}
+                    for encoding, suffix in VARIANT_SUFFIXES.items():
+                        variant = path.with_name(path.name + suffix)
+                        if variant.is_file():
+                            variants[encoding] = variant.read_bytes()
+                else:
+                    variants = self._compress_variants(body, media_type)
+                assets[relative] = Asset(
+                    body=body,
+                    media_type=media_type,
+                    cache_control=IMMUTABLE if relative in hashed else REVALIDATE,
+                    variants=variants,
+                )
+        return assets
+
+    def _compress_variants(self, body: bytes, media_type: str) -> Dict[str, bytes]:
+        if not media_type.startswith(COMPRESSIBLE_TYPES):
+            return {}
+        encodings = ["gzip"] + (["br"] if brotli is not None else [])
+        variants = {encoding: compress_body(body, encoding) for encoding in encodings}
+        return {encoding: data for encoding, data in variants.items() if len(data) < len(body)}
+
+    async def get(self, path: str) -> Optional[Asset]:
+        assets = self._assets if self._assets is not None else await asyncio.to_thread(self.load)
+        return assets.get(path or "index.html")
+
+frontend_service = FrontendService(Path(settings.FRONTEND_DIR))
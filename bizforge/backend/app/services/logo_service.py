@@ -0,0 +1,203 @@
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Optional
+from urllib.parse import urlencode
+from xml.sax.saxutils import escape
+
+# Simple vector glyphs drawn on a 100x100 grid, keyed by icon keyword
+ICON_GLYPHS = {
+    "circuit": '<circle cx="50" cy="50" r="14"/><circle cx="14" cy="14" r="8"/><circle cx="86" cy="14" r="8"/>'
+               '<circle cx="14" cy="86" r="8"/><circle cx="86" cy="86" r="8"/>'
+               '<path d="M20 20L40 40M80 20L60 40M20 80L40 60M80 80L60 60" stroke-width="6" stroke="currentColor"/>',
+    "leaf": '<path d="M50 8C82 24 88 66 50 92C12 66 18 24 50 8Z"/>'
+            '<path d="M50 28V84" stroke-width="5" stroke="#ffffff" fill="none"/>',
+    "bolt": '<path d="M58 6L20 56H46L40 94L80 40H54Z"/>',
+    "shield": '<path d="M50 6L88 20V48C88 70 72 86 50 94C28 86 12 70 12 48V20Z"/>',
+    "arrow": '<path d="M10 78L38 50L54 64L76 40L64 30H92V58L82 48L54 78L38 64L20 84Z"/>',
+    "book": '<path d="M50 22C38 14 22 14 10 18V82C22 78 38 78 50 86C62 78 78 78 90 82V18C78 14 62 14 50 22Z"/>'
+            '<path d="M50 24V84" stroke-width="4" stroke="#ffffff" fill="none"/>',
+    "heart": '<path d="M50 88C20 66 8 48 8 32C8 18 20 8 33 8C41 8 47 13 50 20C53 13 59 8 67 8C80 8 92 18 92 32C92 48 80 66 50 88Z"/>',
+    "bag": '<path d="M14 34H86L80 92H20Z"/>'
+           '<path d="M34 40V26C34 16 41 10 50 10C59 10 66 16 66 26V40" stroke-width="6" stroke="currentColor" fill="none"/>',
+    "diamond": '<path d="M50 6L94 50L50 94L6 50Z"/><path d="M50 30L70 50L50 70L30 50Z" fill="#ffffff"/>',
+}
+
+# Icon phrases from VisualService.INDUSTRY_ICONS mapped onto the glyphs above
+ICON_KEYWORDS = [
+    ("circuit", "circuit"), ("node", "circuit"), ("tech", "circuit"), ("data", "circuit"),
+    ("leaf", "leaf"), ("organic", "leaf"), ("natural", "leaf"), ("fresh", "leaf"),
+    ("dynamic", "bolt"), ("movement", "bolt"), ("energy", "bolt"), ("active", "bolt"),
+    ("shield", "shield"), ("secure", "shield"), ("trust", "shield"),
+    ("arrow", "arrow"), ("growth", "arrow"),
+    ("book", "book"), ("knowledge", "book"), ("learning", "book"),
+    ("wellness", "heart"), ("care", "heart"), ("vitality", "heart"), ("health", "heart"),
+    ("shopping", "bag"), ("product", "bag"), ("store", "bag"), ("commerce", "bag"),
+]
+
+# Layout phrases from VisualService.LAYOUT_STYLES mapped onto renderer layouts
+LAYOUT_KEYWORDS = [
+    ("monogram", "monogram"),
+    ("badge", "badge"),
+    ("emblem", "emblem"),
+    ("horizontal", "horizontal"),
+    ("beside", "horizontal"),
+    ("above", "stacked"),
+]
+
+# Palette entries end up inside SVG attributes, so only plain hex colors are allowed
+HEX_COLOR = re.compile(r"^#[0-9a-fA-F]{3,8}$")
+DEFAULT_COLOR = "#6366f1"
+
+FONT_FAMILY = "Inter, 'Helvetica Neue', Arial, sans-serif"
+
+
+class LogoService:
+    """Renders brand logos as SVG in-process, so the fallback needs no network."""
+
+    MAX_CACHE_ENTRIES = 512
+
+    def __init__(self):
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+
+    def render(self, name: str, color_palette: list, layout: str = "", icon: str = "") -> str:
+        """Render (or fetch from cache) a logo and return its content id."""
+        palette, layout_kind, icon_kind = self._normalize(color_palette, layout, icon)
+        logo_id = self._digest(name, palette, layout_kind, icon_kind)
+
+        if logo_id in self._cache:
+            self._cache.move_to_end(logo_id)
+            return logo_id
+
+        self._cache[logo_id] = self._build_svg(name, palette, layout_kind, icon_kind)
+        if len(self._cache) > self.MAX_CACHE_ENTRIES:
+            self._cache.popitem(last=False)
+        return logo_id
+
+    def logo_path(self, name: str, color_palette: list, layout: str = "", icon: str = "") -> str:
+        """
+        Render a logo and return its URL path (relative to the API prefix).
+        The render inputs travel in the query string, so any worker can
+        rebuild the SVG after a restart or cache eviction.
+        """
+        palette, layout_kind, icon_kind = self._normalize(color_palette, layout, icon)
+        logo_id = self.render(name, palette, layout_kind, icon_kind)
+        query = urlencode({"name": name, "colors": ",".join(palette), "layout": layout_kind, "icon": icon_kind})
+        return f"/logos/{logo_id}.svg?{query}"
+
+    def get_svg(self, logo_id: str, name: str = None, colors: str = "", layout: str = "", icon: str = "") -> Optional[str]:
+        svg = self._cache.get(logo_id)
+        if svg is not None:
+            self._cache.move_to_end(logo_id)
+            return svg
+        if name is None:
+            return None
+
+        # Cache miss: re-render, but only if the inputs really produce this id
+        palette, layout_kind, icon_kind = self._normalize(colors.split(","), layout, icon)
+        if self._digest(name, palette, layout_kind, icon_kind) != logo_id:
+            return None
+        return self._cache[self.render(name, palette, layout_kind, icon_kind)]
+
+    def _normalize(self, color_palette: list, layout: str, icon: str) -> tuple[list, str, str]:
+        palette = [c for c in (color_palette or []) if isinstance(c, str) and HEX_COLOR.match(c)] or [DEFAULT_COLOR]
+        layout_kind = self._resolve(layout, LAYOUT_KEYWORDS, "stacked")
+        icon_kind = self._resolve(icon, ICON_KEYWORDS, "diamond")
+        return palette, layout_kind, icon_kind
+
+    def _digest(self, name: str, palette: list, layout: str, icon: str) -> str:
+        key = "\x1f".join([name, ",".join(palette), layout, icon])
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+
+    def _resolve(self, phrase: str, keywords: list, default: str) -> str:
+        phrase = phrase.lower()
+        # Already-resolved values (as found in logo URLs) map to themselves
+        if phrase in {value for _, value in keywords} | {default}:
+            return phrase
+        for keyword, value in keywords:
+            if keyword in phrase:
+                return value
+        return default
+
+    def _colors(self, palette: list) -> tuple[str, str]:
+        """Pick a primary and an accent color that stay visible on white."""
+        usable = [c for c in palette if c.lower() not in ("#ffffff", "#fff", "#f8fafc", "#f5f5f5")]
+        primary = usable[0] if usable else DEFAULT_COLOR
+        accent = usable[2] if len(usable) > 2 else (usable[-1] if usable else primary)
+        return primary, accent
+
+    def _initials(self, name: str) -> str:
+        words = name.split()
+        if len(words) > 1:
+            return (words[0][0] + words[1][0]).upper()
+        capitals = [c for c in name if c.isupper()]
+        if len(capitals) > 1:
+            return "".join(capitals[:2])
+        return name[:1].upper() or "?"
+
+    def _glyph(self, icon_kind: str, x: float, y: float, size: float, color: str) -> str:
+        scale = size / 100
+        return (
+            f'<g transform="translate({x:g} {y:g}) scale({scale:g})" fill="{color}" color="{color}">'
+            f'{ICON_GLYPHS[icon_kind]}</g>'
+        )
+
+    def _text(self, text: str, x: float, y: float, size: float, color: str, anchor: str = "middle") -> str:
+        return (
+            f'<text x="{x:g}" y="{y:g}" font-family="{FONT_FAMILY}" font-size="{size:g}" font-weight="700" '
+            f'fill="{color}" text-anchor="{anchor}" dominant-baseline="middle">{escape(text)}</text>'
+        )
+
+    def _build_svg(self, name: str, palette: list, layout_kind: str, icon_kind: str) -> str:
+        primary, accent = self._colors(palette)
+
+        # Rough text width estimate for a bold sans-serif face
+        text_size = 72
+        text_width = max(len(name), 1) * text_size * 0.62
+
+        if layout_kind == "horizontal":
+            width, height = int(text_width + 280), 240
+            body = (
+                self._glyph(icon_kind, 40, 40, 160, primary)
+                + self._text(name, 240, 120, text_size, primary, anchor="start")
+            )
+        elif layout_kind == "monogram":
+            width, height = max(int(text_width + 80), 400), 520
+            body = (
+                f'<rect x="{width / 2 - 130:g}" y="30" width="260" height="260" rx="48" fill="{primary}"/>'
+                + self._text(self._initials(name), width / 2, 162, 130, "#ffffff")
+                + self._glyph(icon_kind, width / 2 + 80, 240, 60, accent)
+                + self._text(name, width / 2, 400, text_size, primary)
+            )
+        elif layout_kind == "emblem":
+            size = max(int(text_width * 1.2 + 80), 520)
+            width = height = size
+            center = size / 2
+            body = (
+                f'<circle cx="{center:g}" cy="{center:g}" r="{center - 12:g}" fill="none" stroke="{primary}" stroke-width="16"/>'
+                f'<circle cx="{center:g}" cy="{center:g}" r="{center - 36:g}" fill="none" stroke="{accent}" stroke-width="4"/>'
+                + self._glyph(icon_kind, center - 90, center - 190, 180, primary)
+                + self._text(name, center, center + 90, text_size, primary)
+            )
+        elif layout_kind == "badge":
+            width, height = max(int(text_width + 120), 480), 480
+            body = (
+                f'<rect x="20" y="20" width="{width - 40}" height="{height - 40}" rx="56" fill="{primary}"/>'
+                f'<circle cx="{width / 2:g}" cy="170" r="110" fill="#ffffff"/>'
+                + self._glyph(icon_kind, width / 2 - 70, 100, 140, accent)
+                + self._text(name, width / 2, 360, text_size, "#ffffff")
+            )
+        else:
+            width, height = max(int(text_width + 80), 400), 400
+            body = (
+                self._glyph(icon_kind, width / 2 - 100, 30, 200, primary)
+                + self._text(name, width / 2, 320, text_size, primary)
+            )
+
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" width="{width}" height="{height}" '
+            f'role="img" aria-label="{escape(name, {chr(34): "&quot;"})} logo">'
+            f'<rect width="100%" height="100%" fill="#ffffff"/>{body}</svg>'
+        )
+
+logo_service = LogoService()
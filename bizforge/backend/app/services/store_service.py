@@ -0,0 +1,261 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Optional
+from app.core.config import settings
+from app.models.schemas import (
+    BrandKit, StrategyAnalysis, StoredKit, StoredKitSummary, StoredKitPage,
+    StoredStrategy, StoredStrategySummary, StoredStrategyPage,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS kits (
+    id INTEGER PRIMARY KEY,
+    brand_name TEXT NOT NULL,
+    industry TEXT NOT NULL,
+    business_idea TEXT NOT NULL,
+    tone TEXT,
+    logo_url TEXT,
+    has_inline_logo INTEGER NOT NULL DEFAULT 0,
+    logo_prompt TEXT,
+    created_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_kits_brand_name ON kits (brand_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_kits_industry ON kits (industry COLLATE NOCASE, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_kits_created_at ON kits (created_at DESC);
+CREATE VIRTUAL TABLE IF NOT EXISTS kits_fts USING fts5 (
+    brand_name, industry, business_idea, content='kits', content_rowid='id'
+);
+-- Inline (data: URL) logos are large, so they live apart from the rows lists scan
+CREATE TABLE IF NOT EXISTS kit_logos (
+    kit_id INTEGER PRIMARY KEY REFERENCES kits (id),
+    data_url TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS strategies (
+    id INTEGER PRIMARY KEY,
+    business_idea TEXT NOT NULL,
+    industry_category TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_strategies_industry ON strategies (industry_category COLLATE NOCASE, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_strategies_created_at ON strategies (created_at DESC);
+CREATE VIRTUAL TABLE IF NOT EXISTS strategies_fts USING fts5 (
+    business_idea, industry_category, content='strategies', content_rowid='id'
+);
+"""
+
+KIT_COLUMNS = "k.id, k.brand_name, k.industry, k.business_idea, k.tone, k.logo_url, k.has_inline_logo, k.created_at"
+STRATEGY_COLUMNS = "s.id, s.business_idea, s.industry_category, s.created_at"
+
+
+def _fts_query(text: str) -> str:
+    """Turn free text into a safe FTS5 query: every word must match, as a prefix."""
+    terms = [term.replace('"', '""') for term in text.split()]
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+class StoreService:
+    """SQLite-backed store for generated brand kits and strategy analyses."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, fn, *args):
+        """Run a blocking SQLite call off the event loop, one at a time."""
+        def locked():
+            with self._lock:
+                return fn(self._connection(), *args)
+        return await asyncio.to_thread(locked)
+
+    async def warm(self):
+        """Open the connection and create the schema ahead of the first request."""
+        await self._run(lambda conn: None)
+
+    # --- Brand kits ---
+    async def save_kit(self, business_idea: str, industry: str, tone: str, kit: BrandKit) -> int:
+        return await self._run(self._save_kit, business_idea, industry, tone, kit)
+
+    def _save_kit(self, conn, business_idea, industry, tone, kit: BrandKit) -> int:
+        brand_name = kit.identity[0].name if kit.identity else ""
+        inline_logo = kit.logo_url.startswith("data:")
+        # The logo is stored once: in kit_logos when inline, otherwise in logo_url
+        payload = kit.model_copy(update={"logo_url": ""}).model_dump_json()
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO kits (brand_name, industry, business_idea, tone, logo_url, has_inline_logo, logo_prompt, created_at, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (brand_name, industry, business_idea, tone, None if inline_logo else kit.logo_url,
+                 int(inline_logo), kit.logo_prompt, time.time(), payload),
+            )
+            kit_id = cursor.lastrowid
+            if inline_logo:
+                conn.execute("INSERT INTO kit_logos (kit_id, data_url) VALUES (?, ?)", (kit_id, kit.logo_url))
+            conn.execute(
+                "INSERT INTO kits_fts (rowid, brand_name, industry, business_idea) VALUES (?, ?, ?, ?)",
+                (kit_id, brand_name, industry, business_idea),
+            )
+        return kit_id
+
+    async def get_kit(self, kit_id: int) -> Optional[StoredKit]:
+        return await self._run(self._get_kit, kit_id)
+
+    def _get_kit(self, conn, kit_id) -> Optional[StoredKit]:
+        row = conn.execute(f"SELECT {KIT_COLUMNS}, k.payload FROM kits k WHERE k.id = ?", (kit_id,)).fetchone()
+        if row is None:
+            return None
+        kit = BrandKit.model_validate_json(row["payload"])
+        kit.logo_url = self._get_logo_url(conn, row) or ""
+        return StoredKit(**self._kit_summary(row).model_dump(), kit=kit)
+
+    async def get_kit_logo(self, kit_id: int) -> Optional[str]:
+        """The stored logo URL for a kit: a data: URL for inline images, else a link."""
+        return await self._run(self._get_kit_logo, kit_id)
+
+    def _get_kit_logo(self, conn, kit_id) -> Optional[str]:
+        row = conn.execute("SELECT k.id, k.logo_url, k.has_inline_logo FROM kits k WHERE k.id = ?", (kit_id,)).fetchone()
+        return self._get_logo_url(conn, row) if row is not None else None
+
+    def _get_logo_url(self, conn, row) -> Optional[str]:
+        if not row["has_inline_logo"]:
+            return row["logo_url"]
+        logo = conn.execute("SELECT data_url FROM kit_logos WHERE kit_id = ?", (row["id"],)).fetchone()
+        return logo["data_url"] if logo is not None else None
+
+    async def list_kits(self, limit: int, offset: int, brand_name: str = None, industry: str = None) -> StoredKitPage:
+        return await self._run(self._list_kits, limit, offset, brand_name, industry)
+
+    def _list_kits(self, conn, limit, offset, brand_name, industry) -> StoredKitPage:
+        clauses, params = [], []
+        if brand_name:
+            clauses.append("k.brand_name = ? COLLATE NOCASE")
+            params.append(brand_name)
+        if industry:
+            clauses.append("k.industry = ? COLLATE NOCASE")
+            params.append(industry)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        total = conn.execute(f"SELECT COUNT(*) FROM kits k {where}", params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT {KIT_COLUMNS} FROM kits k {where} ORDER BY k.created_at DESC LIMIT ? OFFSET ?",
+            [*params, limit, offset],
+        ).fetchall()
+        return StoredKitPage(items=[self._kit_summary(r) for r in rows], total=total, limit=limit, offset=offset)
+
+    async def search_kits(self, query: str, limit: int, offset: int) -> StoredKitPage:
+        return await self._run(self._search_kits, query, limit, offset)
+
+    def _search_kits(self, conn, query, limit, offset) -> StoredKitPage:
+        match = _fts_query(query)
+        if not match:
+            return StoredKitPage(items=[], total=0, limit=limit, offset=offset)
+        total = conn.execute("SELECT COUNT(*) FROM kits_fts WHERE kits_fts MATCH ?", (match,)).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT {KIT_COLUMNS} FROM kits_fts JOIN kits k ON k.id = kits_fts.rowid "
+            "WHERE kits_fts MATCH ? ORDER BY kits_fts.rank LIMIT ? OFFSET ?",
+            (match, limit, offset),
+        ).fetchall()
+        return StoredKitPage(items=[self._kit_summary(r) for r in rows], total=total, limit=limit, offset=offset)
+
+    def _kit_summary(self, row) -> StoredKitSummary:
+        return StoredKitSummary(
+            id=row["id"],
+            brand_name=row["brand_name"],
+            industry=row["industry"],
+            business_idea=row["business_idea"],
+            tone=row["tone"],
+            # Never inline the image in summaries; point at the logo endpoint instead
+            logo_url=f"{settings.API_V1_STR}/kits/{row['id']}/logo" if row["has_inline_logo"] else row["logo_url"],
+            created_at=row["created_at"],
+        )
+
+    # --- Strategy analyses ---
+    async def save_strategy(self, business_idea: str, analysis: StrategyAnalysis) -> int:
+        return await self._run(self._save_strategy, business_idea, analysis)
+
+    def _save_strategy(self, conn, business_idea, analysis: StrategyAnalysis) -> int:
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO strategies (business_idea, industry_category, created_at, payload) VALUES (?, ?, ?, ?)",
+                (business_idea, analysis.industry_category, time.time(), analysis.model_dump_json()),
+            )
+            strategy_id = cursor.lastrowid
+            conn.execute(
+                "INSERT INTO strategies_fts (rowid, business_idea, industry_category) VALUES (?, ?, ?)",
+                (strategy_id, business_idea, analysis.industry_category),
+            )
+        return strategy_id
+
+    async def get_strategy(self, strategy_id: int) -> Optional[StoredStrategy]:
+        return await self._run(self._get_strategy, strategy_id)
+
+    def _get_strategy(self, conn, strategy_id) -> Optional[StoredStrategy]:
+        row = conn.execute(
+            f"SELECT {STRATEGY_COLUMNS}, s.payload FROM strategies s WHERE s.id = ?", (strategy_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return StoredStrategy(
+            **self._strategy_summary(row).model_dump(),
+            analysis=StrategyAnalysis.model_validate_json(row["payload"]),
+        )
+
+    async def list_strategies(self, limit: int, offset: int, industry: str = None) -> StoredStrategyPage:
+        return await self._run(self._list_strategies, limit, offset, industry)
+
+    def _list_strategies(self, conn, limit, offset, industry) -> StoredStrategyPage:
+        where, params = "", []
+        if industry:
+            where, params = "WHERE s.industry_category = ? COLLATE NOCASE", [industry]
+        total = conn.execute(f"SELECT COUNT(*) FROM strategies s {where}", params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT {STRATEGY_COLUMNS} FROM strategies s {where} ORDER BY s.created_at DESC LIMIT ? OFFSET ?",
+            [*params, limit, offset],
+        ).fetchall()
+        return StoredStrategyPage(
+            items=[self._strategy_summary(r) for r in rows], total=total, limit=limit, offset=offset
+        )
+
+    async def search_strategies(self, query: str, limit: int, offset: int) -> StoredStrategyPage:
+        return await self._run(self._search_strategies, query, limit, offset)
+
+    def _search_strategies(self, conn, query, limit, offset) -> StoredStrategyPage:
+        match = _fts_query(query)
+        if not match:
+            return StoredStrategyPage(items=[], total=0, limit=limit, offset=offset)
+        total = conn.execute(
+            "SELECT COUNT(*) FROM strategies_fts WHERE strategies_fts MATCH ?", (match,)
+        ).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT {STRATEGY_COLUMNS} FROM strategies_fts JOIN strategies s ON s.id = strategies_fts.rowid "
+            "WHERE strategies_fts MATCH ? ORDER BY strategies_fts.rank LIMIT ? OFFSET ?",
+            (match, limit, offset),
+        ).fetchall()
+        return StoredStrategyPage(
+            items=[self._strategy_summary(r) for r in rows], total=total, limit=limit, offset=offset
+        )
+
+    def _strategy_summary(self, row) -> StoredStrategySummary:
+        return StoredStrategySummary(
+            id=row["id"],
+            business_idea=row["business_idea"],
+            industry_category=row["industry_category"],
+            created_at=row["created_at"],
+        )
+
+store_service = StoreService(settings.DATABASE_PATH)
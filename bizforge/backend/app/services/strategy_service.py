@@ -1,6 +1,7 @@
-import httpx
 import json
 from app.core.config import settings
+from app.core.http import http_client
+from app.core.deadline import report_fallback, upstream_timeout
 from app.models.schemas import StrategyAnalysis, TargetAudienceData, AttractionStrategyData, MarketingStrategiesData
 
 class StrategyService:
@@ -10,7 +11,7 @@ class StrategyService:
         Returns structured insights across 9 key strategic areas.
         """
         if not settings.GROQ_API_KEY:
-            return self._mock_strategy_analysis(business_idea)
+            return self.fallback_analysis(business_idea)
 
         prompt = f"""You are a senior startup strategist, brand positioning expert, and growth marketing consultant with decades of experience guiding new businesses to stand out in competitive markets.
 
@@ -77,48 +78,49 @@ QUALITY RULES
 """
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.groq.com/openai/v1/chat/completions",
-                    headers={"Authorization": f"Bearer {settings.GROQ_API_KEY}"},
-                    json={
-                        "model": settings.GROQ_MODEL,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0.7,
-                        "max_tokens": 2000
-                    },
-                    timeout=60.0
-                )
-                response.raise_for_status()
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
+            client = http_client()
+            response = await client.post(
+                "https://api.groq.com/openai/v1/chat/completions",
+                headers={"Authorization": f"Bearer {settings.GROQ_API_KEY}"},
+                json={
+                    "model": settings.GROQ_MODEL,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": 0.7,
+                    "max_tokens": 2000
+                },
+                timeout=upstream_timeout(60.0)
+            )
+            response.raise_for_status()
+            data = response.json()
+            content = data["choices"][0]["message"]["content"]
                 
-                # Clean content if it has markdown ticks
-                content = content.replace("```json", "").replace("```", "").strip()
+            # Clean content if it has markdown ticks
+            content = content.replace("```json", "").replace("```", "").strip()
                 
-                # Parse JSON response
-                parsed = json.loads(content)
+            # Parse JSON response
+            parsed = json.loads(content)
                 
-                # Convert to StrategyAnalysis model
-                return StrategyAnalysis(
-                    industry_category=parsed["industry_category"],
-                    market_offerings=parsed["market_offerings"],
-                    saturation_level=parsed["saturation_level"],
-                    saturation_explanation=parsed["saturation_explanation"],
-                    differentiation_opportunities=parsed["differentiation_opportunities"],
-                    value_positioning=parsed["value_positioning"],
-                    target_audience=TargetAudienceData(**parsed["target_audience"]),
-                    attraction_strategy=AttractionStrategyData(**parsed["attraction_strategy"]),
-                    marketing_strategies=MarketingStrategiesData(**parsed["marketing_strategies"]),
-                    strategic_advice=parsed["strategic_advice"]
-                )
+            # Convert to StrategyAnalysis model
+            return StrategyAnalysis(
+                industry_category=parsed["industry_category"],
+                market_offerings=parsed["market_offerings"],
+                saturation_level=parsed["saturation_level"],
+                saturation_explanation=parsed["saturation_explanation"],
+                differentiation_opportunities=parsed["differentiation_opportunities"],
+                value_positioning=parsed["value_positioning"],
+                target_audience=TargetAudienceData(**parsed["target_audience"]),
+                attraction_strategy=AttractionStrategyData(**parsed["attraction_strategy"]),
+                marketing_strategies=MarketingStrategiesData(**parsed["marketing_strategies"]),
+                strategic_advice=parsed["strategic_advice"]
+            )
 
         except Exception as e:
             print(f"Strategy Service Error: {e}")
-            return self._mock_strategy_analysis(business_idea)
+            return self.fallback_analysis(business_idea)
 
-    def _mock_strategy_analysis(self, business_idea: str) -> StrategyAnalysis:
+    def fallback_analysis(self, business_idea: str) -> StrategyAnalysis:
         """Fallback mock data when API is unavailable"""
+        report_fallback()
         return StrategyAnalysis(
             industry_category="Technology / SaaS",
             market_offerings=[
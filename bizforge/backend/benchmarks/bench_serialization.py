@@ -0,0 +1,90 @@
+"""
+Serialization CPU per request: FastAPI's default response path versus
+FastJSONResponse, plus the cost and payoff of compressing the result.
+
+Run from the backend folder:
+    python -m benchmarks.bench_serialization
+"""
+import asyncio
+import base64
+import gzip
+import json
+import os
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.core.compression import brotli
+from app.core.responses import FastJSONResponse
+from app.models.schemas import BrandIdentity, BrandKit, SocialContent
+
+ITERATIONS = 200
+
+
+def build_kit() -> BrandKit:
+    """A BrandKit shaped like a real Stability response (1024x1024 PNG as base64)."""
+    logo_b64 = base64.b64encode(os.urandom(1_200_000)).decode("ascii")
+    return BrandKit(
+        identity=[BrandIdentity(name=f"Brand {i}", tagline="Sustainably yours, every day.", score=90 + i) for i in range(3)],
+        description="A revolutionary food startup focusing on eco friendly coffee cups.",
+        social_media=[
+            SocialContent(platform=p, content="Meet the cup that loves the planet back. " * 6, hashtags=["#eco", "#coffee", "#zerowaste"])
+            for p in ("LinkedIn", "Twitter", "Instagram")
+        ],
+        email_copy="Welcome aboard! " * 80,
+        logo_prompt="Create a single professional logo design. " * 30,
+        logo_url=f"data:image/png;base64,{logo_b64}",
+        sentiment_analysis="Detected Sentiment: POSITIVE (99.1%)",
+        color_palette=["#0f172a", "#334155", "#475569", "#94a3b8", "#f8fafc"],
+        brand_summary="Reusable cups for daily coffee drinkers. " * 4,
+    )
+
+
+def cpu_per_call(fn) -> float:
+    """Average process CPU time of fn() in milliseconds."""
+    fn()  # warm-up
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.process_time() - start) / ITERATIONS * 1000
+
+
+def main():
+    kit = build_kit()
+    field = create_response_field(name="Response_generate", type_=BrandKit)
+    loop = asyncio.new_event_loop()
+
+    def before() -> bytes:
+        # What FastAPI does for `return kit` with response_model=BrandKit
+        content = loop.run_until_complete(serialize_response(field=field, response_content=kit))
+        return JSONResponse(content).body
+
+    def after() -> bytes:
+        return FastJSONResponse(kit).body
+
+    body = after()
+    assert json.loads(before()) == json.loads(body)
+
+    print(f"payload: {len(body) / 1024:.0f} KiB, {ITERATIONS} iterations\n")
+    print(f"{'path':<42}{'CPU ms/request':>16}")
+    print(f"{'default (re-validate + jsonable_encoder)':<42}{cpu_per_call(before):>16.2f}")
+    print(f"{'FastJSONResponse':<42}{cpu_per_call(after):>16.2f}")
+
+    # Typical JSON response without an embedded image
+    small = kit.model_copy(update={"logo_url": "/api/v1/logos/64c65c5bd86a8d2e9b2d4c02.svg"})
+    small_body = FastJSONResponse(small).body
+    print(f"\ncompression of a {len(small_body) / 1024:.1f} KiB kit without inline logo:")
+    print(f"{'encoding':<42}{'CPU ms/request':>16}{'bytes':>10}")
+    print(f"{'gzip (level 6)':<42}{cpu_per_call(lambda: gzip.compress(small_body, 6)):>16.3f}"
+          f"{len(gzip.compress(small_body, 6)):>10}")
+    if brotli is not None:
+        print(f"{'brotli (quality 4)':<42}{cpu_per_call(lambda: brotli.compress(small_body, quality=4)):>16.3f}"
+              f"{len(brotli.compress(small_body, quality=4)):>10}")
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
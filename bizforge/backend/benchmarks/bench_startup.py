@@ -0,0 +1,57 @@
+"""
+Cold-start time of the API process: module imports plus the lifespan
+warm-up, measured in fresh interpreters. Upstream pre-connects only run
+for configured API keys, so with none set this needs no network.
+
+Run from the backend folder:
+    python -m benchmarks.bench_startup
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RUNS = 5
+
+CHILD = """
+import json, time
+from fastapi.testclient import TestClient
+from app.main import app
+with TestClient(app) as client:
+    while True:
+        response = client.get("/ready")
+        if response.status_code == 200:
+            break
+        time.sleep(0.005)
+    print(json.dumps(response.json()))
+"""
+
+
+def run_once(env: dict) -> tuple[float, dict]:
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return time.perf_counter() - start, json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {**os.environ, "DATABASE_PATH": os.path.join(tmp, "bench.db")}
+        results = [run_once(env) for _ in range(RUNS)]
+
+    wall = [w for w, _ in results]
+    imports = [r["import_seconds"] for _, r in results]
+    warmup = [r["warmup_seconds"] for _, r in results]
+    print(f"{RUNS} fresh processes, median seconds")
+    print(f"{'process start to ready (wall)':<32}{statistics.median(wall):>8.3f}")
+    print(f"{'app imports':<32}{statistics.median(imports):>8.3f}")
+    print(f"{'warm-up stage':<32}{statistics.median(warmup):>8.3f}")
+    print(f"steps (last run, ms): {results[-1][1]['steps_ms']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Build the frontend for serving from the API.
+
+Copies ../frontend into ../frontend/dist with content-hashed CSS/JS file
+names (so they can be cached forever), rewrites index.html to point at
+them, and writes gzip/brotli variants next to every text asset.
+
+    python build_frontend.py
+"""
+import gzip
+import hashlib
+import json
+import re
+import shutil
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; only gzip variants are written then
+    brotli = None
+
+FRONTEND_DIR = Path(__file__).resolve().parent.parent / "frontend"
+DIST_DIR = FRONTEND_DIR / "dist"
+HASHED_SUFFIXES = (".css", ".js")
+COMPRESSED_SUFFIXES = (".html", ".css", ".js", ".svg", ".json")
+
+
+def hashed_name(path: Path, body: bytes) -> str:
+    digest = hashlib.sha256(body).hexdigest()[:12]
+    return f"{path.stem}.{digest}{path.suffix}"
+
+
+def write_variants(path: Path, body: bytes):
+    """Write .gz/.br siblings, skipping any that would not be smaller."""
+    variants = {".gz": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(body, quality=11)
+    for suffix, compressed in variants.items():
+        if len(compressed) < len(body):
+            path.with_name(path.name + suffix).write_bytes(compressed)
+
+
+def build() -> dict:
+    if DIST_DIR.exists():
+        shutil.rmtree(DIST_DIR)
+    DIST_DIR.mkdir()
+
+    # Asset path relative to the frontend root -> hashed path
+    manifest = {}
+    for source in sorted(FRONTEND_DIR.rglob("*")):
+        if not source.is_file() or DIST_DIR in source.parents or source.name == "index.html":
+            continue
+        relative = source.relative_to(FRONTEND_DIR)
+        body = source.read_bytes()
+        if source.suffix in HASHED_SUFFIXES:
+            target = relative.with_name(hashed_name(source, body))
+            manifest[relative.as_posix()] = target.as_posix()
+        else:
+            target = relative
+        destination = DIST_DIR / target
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(body)
+        if source.suffix in COMPRESSED_SUFFIXES:
+            write_variants(destination, body)
+
+    # Point index.html at the hashed names
+    index = (FRONTEND_DIR / "index.html").read_text(encoding="utf-8")
+    for original, hashed in manifest.items():
+        index = re.sub(rf'(href|src)="{re.escape(original)}"', rf'\1="{hashed}"', index)
+    index_body = index.encode("utf-8")
+    (DIST_DIR / "index.html").write_bytes(index_body)
+    write_variants(DIST_DIR / "index.html", index_body)
+
+    (DIST_DIR / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+if __name__ == "__main__":
+    for original, hashed in build().items():
+        print(f"{original} -> {hashed}")
+    print(f"Frontend built into {DIST_DIR}")
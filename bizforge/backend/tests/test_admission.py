@@ -0,0 +1,79 @@
+import asyncio
+
+from app.core.admission import AdmissionController, Overloaded, TrafficClass
+
+
+def make_controller(wait_budget: float = 0.2) -> AdmissionController:
+    return AdmissionController(
+        total_slots=16,
+        classes=[
+            TrafficClass("interactive", priority=0, limit=16),
+            TrafficClass("generate", priority=1, limit=8),
+            TrafficClass("batch", priority=2, limit=4),
+        ],
+        wait_budget=wait_budget,
+        max_queue=64,
+    )
+
+
+def test_lower_class_not_blocked_by_waiter_at_its_own_limit():
+    async def scenario():
+        controller = make_controller()
+        for _ in range(8):
+            await controller.acquire("generate")
+
+        # A ninth generate request has to queue: its class is full
+        queued = asyncio.ensure_future(controller.acquire("generate"))
+        await asyncio.sleep(0)
+        assert controller.stats()["queue_depth"] == 1
+
+        # Half the slots are free and batch has none in use, so it must be admitted
+        await asyncio.wait_for(controller.acquire("batch"), timeout=0.1)
+        assert controller.classes["batch"].in_flight == 1
+
+        controller.release("generate")
+        await asyncio.wait_for(queued, timeout=0.1)
+        assert controller.classes["generate"].in_flight == 8
+
+    asyncio.run(scenario())
+
+
+def test_higher_priority_waiter_is_served_first():
+    async def scenario():
+        controller = make_controller(wait_budget=1.0)
+        controller.total_slots = 1
+        await controller.acquire("batch")
+
+        order = []
+
+        async def request(class_name):
+            await controller.acquire(class_name)
+            order.append(class_name)
+
+        waiters = [asyncio.ensure_future(request(name)) for name in ("batch", "generate", "interactive")]
+        await asyncio.sleep(0)
+
+        for _ in range(3):
+            controller.release(order[-1] if order else "batch")
+            await asyncio.sleep(0)
+        await asyncio.gather(*waiters)
+        assert order == ["interactive", "generate", "batch"]
+
+    asyncio.run(scenario())
+
+
+def test_request_is_shed_after_wait_budget():
+    async def scenario():
+        controller = make_controller(wait_budget=0.05)
+        for _ in range(4):
+            await controller.acquire("batch")
+        try:
+            await controller.acquire("batch")
+        except Overloaded as e:
+            assert e.retry_after == 0.05
+        else:
+            raise AssertionError("expected the request to be shed")
+        assert controller.classes["batch"].shed == 1
+        assert controller.stats()["queue_depth"] == 0
+
+    asyncio.run(scenario())
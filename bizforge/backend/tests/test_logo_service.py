@@ -0,0 +1,37 @@
+from app.services.logo_service import DEFAULT_COLOR, LogoService
+
+
+def test_palette_entries_that_are_not_hex_colors_are_dropped():
+    service = LogoService()
+    logo_id = service.render("Acme", ['red"/><script>alert(1)</script>', "#10b981"])
+    svg = service.get_svg(logo_id)
+
+    assert "<script" not in svg
+    assert "red" not in svg
+    assert 'fill="#10b981"' in svg
+
+
+def test_only_invalid_colors_fall_back_to_the_default():
+    service = LogoService()
+    svg = service.get_svg(service.render("Acme", ['"><script>', "url(javascript:x)"]))
+    assert "<script" not in svg
+    assert f'fill="{DEFAULT_COLOR}"' in svg
+
+
+def test_brand_name_is_escaped_in_text_and_attributes():
+    service = LogoService()
+    name = 'Evil "Co" </text><script>x</script>'
+    svg = service.get_svg(service.render(name, ["#0f172a"]))
+
+    assert "<script" not in svg
+    assert "&lt;/text&gt;&lt;script&gt;" in svg
+    assert 'aria-label="Evil &quot;Co&quot;' in svg
+
+
+def test_rerender_from_url_rejects_tampered_inputs():
+    service = LogoService()
+    logo_id = service.render("Acme", ["#10b981"])
+    fresh = LogoService()
+
+    assert fresh.get_svg(logo_id, name="Acme", colors='#10b981"/><script>') is None
+    assert fresh.get_svg(logo_id, name="Acme", colors="#10b981") == service.get_svg(logo_id)
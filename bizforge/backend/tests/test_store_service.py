@@ -0,0 +1,48 @@
+import asyncio
+
+from app.models.schemas import BrandIdentity, BrandKit
+from app.services.store_service import StoreService
+
+QUERIES = ['"', 'dog "bakery', "dog AND", "OR", "NOT dog", "*", "dog*", "bak* OR -x", "(dog", "NEAR(dog bakery)", "col:dog", "^dog"]
+
+
+def make_kit(name: str) -> BrandKit:
+    return BrandKit(
+        identity=[BrandIdentity(name=name, tagline="Fresh treats", score=90)],
+        description="desc",
+        social_media=[],
+        email_copy="Welcome",
+        logo_prompt="prompt",
+        logo_url="/api/v1/logos/abc.svg",
+        sentiment_analysis="Positive",
+        color_palette=["#10b981"],
+        brand_summary="summary",
+    )
+
+
+def test_search_with_fts_syntax_never_raises(tmp_path):
+    async def scenario():
+        store = StoreService(str(tmp_path / "store.db"))
+        await store.save_kit('Artisanal "dog" bakery', "Food", "Playful", make_kit("Woof AND Co"))
+
+        for query in QUERIES:
+            page = await store.search_kits(query, limit=20, offset=0)
+            assert page.total == len(page.items)
+            await store.search_strategies(query, limit=20, offset=0)
+
+    asyncio.run(scenario())
+
+
+def test_search_treats_operators_and_quotes_as_words(tmp_path):
+    async def scenario():
+        store = StoreService(str(tmp_path / "store.db"))
+        await store.save_kit('Artisanal "dog" bakery', "Food", "Playful", make_kit("Woof AND Co"))
+        await store.save_kit("Cat toys", "Retail", "Playful", make_kit("Meow"))
+
+        assert (await store.search_kits("dog bak", 20, 0)).total == 1
+        assert (await store.search_kits('"dog"', 20, 0)).total == 1
+        assert (await store.search_kits("woof AND", 20, 0)).items[0].brand_name == "Woof AND Co"
+        assert (await store.search_kits("dog OR cat", 20, 0)).total == 0
+        assert (await store.search_kits("   ", 20, 0)).total == 0
+
+    asyncio.run(scenario())
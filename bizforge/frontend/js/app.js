@@ -1,4 +1,12 @@
-const API_URL = "http://localhost:8000/api/v1";
+// Served by the API itself in production, so calls are same-origin (no CORS preflight).
+// Opening index.html straight from disk still talks to a local backend.
+const API_ORIGIN = window.location.protocol === "file:" ? "http://localhost:8000" : "";
+const API_URL = `${API_ORIGIN}/api/v1`;
+
+// Locally rendered logos come back as API-relative paths
+function resolveLogoUrl(url) {
+    return url && url.startsWith("/") ? `${API_ORIGIN}${url}` : url;
+}
 
 document.addEventListener("DOMContentLoaded", () => {
     const generateBtn = document.getElementById("generate-btn");
@@ -138,7 +146,7 @@ document.addEventListener("DOMContentLoaded", () => {
         });
 
         // 2. Visuals
-        logoContainer.innerHTML = `<img src="${data.logo_url}" alt="Generated Logo" />`;
+        logoContainer.innerHTML = `<img src="${resolveLogoUrl(data.logo_url)}" alt="Generated Logo" />`;
 
         // Store for preview
         currentPalette = data.color_palette;
@@ -197,7 +205,7 @@ document.addEventListener("DOMContentLoaded", () => {
             industry: businessIdeaInput.value.split(',')[0] || industryInput.value,
             tone: toneSelect.value,
             color_palette: data.color_palette,
-            url: data.logo_url
+            url: resolveLogoUrl(data.logo_url)
         };
 
         // Show logo control buttons
@@ -310,8 +318,8 @@ document.addEventListener("DOMContentLoaded", () => {
             if (!response.ok) throw new Error("Failed to regenerate logo");
 
             const data = await response.json();
-            logoContainer.innerHTML = `<img src="${data.logo_url}" alt="Regenerated Logo" />`;
-            currentLogoData.url = data.logo_url;
+            currentLogoData.url = resolveLogoUrl(data.logo_url);
+            logoContainer.innerHTML = `<img src="${currentLogoData.url}" alt="Regenerated Logo" />`;
 
         } catch (error) {
             console.error(error);
@@ -327,7 +335,8 @@ document.addEventListener("DOMContentLoaded", () => {
 
         const link = document.createElement('a');
         link.href = currentLogoData.url;
-        link.download = `${currentLogoData.name.replace(/\s+/g, '_')}_logo.png`;
+        const extension = currentLogoData.url.includes(".svg") ? "svg" : "png";
+        link.download = `${currentLogoData.name.replace(/\s+/g, '_')}_logo.${extension}`;
         document.body.appendChild(link);
         link.click();
         document.body.removeChild(link);